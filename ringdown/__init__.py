@@ -9,8 +9,15 @@ from . import qnms
 from . import model
 from . import utils
 
-from importlib.metadata import version
-__version__ = version("ringdown")
+
+def __getattr__(name):
+    # resolve the version lazily: scanning the installed metadata is slow
+    # and only needed if __version__ is actually requested
+    if name == "__version__":
+        from importlib.metadata import version
+        return version("ringdown")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ############################################################################
 # rcParams
@@ -8,6 +8,8 @@ import arviz as az
 import json
 import configparser
 import copy as cp
+import multiprocessing as mp
+from functools import partial
 import os
 import warnings
 import inspect
@@ -42,6 +44,9 @@ for k in SAMPLER_ARGS:
 MODEL_ARGS = inspect.signature(make_model).parameters.keys()
 RUNTIME_MODEL_ARGS = ['modes', 'prior', 'predictive', 'store_h_det',
                       'store_h_det_mode']
+VALID_MODEL_SETTINGS = [k for k in MODEL_ARGS if k not in RUNTIME_MODEL_ARGS]
+# map lowercased names to canonical ones for O(1) case-insensitive lookups
+_VALID_MODEL_SETTINGS_LOW = {k.lower(): k for k in VALID_MODEL_SETTINGS}
 
 DEF_RUN_KWS = dict(dense_mass=True, num_warmup=1000, num_samples=1000,
                    num_chains=4)
@@ -146,6 +151,7 @@ class Fit(object):
         self._n_analyze = None
         self._duration = None
         self._raw_data = None
+        self._reset_cache()
         # set strain scale
         self._strain_scale = None
         self.auto_scale = strain_scale == 'auto'
@@ -162,9 +168,57 @@ class Fit(object):
     def __repr__(self):
         return f"Fit({self.modes}, ifos={self.ifos})"
 
+    def _reset_cache(self):
+        """Clear cached quantities derived from the data and target."""
+        self._start_indices = None
+        self._cholesky_cache = {}
+        self._run_input_cache = None
+        self._analysis_data_cache = None
+        self._start_times_cache = None
+        self._antenna_patterns_cache = None
+
+    def _get_cholesky(self, ifo, n):
+        """Cholesky factor of the covariance matrix for a given detector,
+        truncated to ``n`` samples; memoized, and recomputed whenever the
+        ACFs change.
+        """
+        key = (ifo, n)
+        if key not in self._cholesky_cache:
+            # delegate to the ACF's own memoized factorization so both
+            # caching layers share a single factor per (ifo, n)
+            self._cholesky_cache[key] = self.acfs[ifo].truncated_cholesky(n)
+        return self._cholesky_cache[key]
+
+    # attributes shared by reference when copying: results are immutable
+    # once produced and can be arbitrarily large, so there is no point in
+    # duplicating them
+    _copy_by_reference = ('result', 'prior', 'imr_result')
+
+    # derived caches handled by _reset_cache: recomputable on demand, so
+    # copies start fresh instead of duplicating potentially large arrays
+    _cache_attributes = ('_start_indices', '_cholesky_cache',
+                         '_run_input_cache', '_analysis_data_cache',
+                         '_start_times_cache', '_antenna_patterns_cache')
+
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        fit_copy = cls.__new__(cls)
+        memo[id(self)] = fit_copy
+        for k, v in self.__dict__.items():
+            if k in self._copy_by_reference:
+                fit_copy.__dict__[k] = v
+            elif k not in self._cache_attributes:
+                fit_copy.__dict__[k] = cp.deepcopy(v, memo)
+        fit_copy._reset_cache()
+        return fit_copy
+
     def copy(self):
         """Produce a deep copy of this `Fit` object.
 
+        Large sampling products (:attr:`Fit.result`, :attr:`Fit.prior` and
+        :attr:`Fit.imr_result`) are shared by reference rather than
+        duplicated, since they are not modified in place by the fit.
+
         Returns
         -------
         fit_copy : Fit
@@ -180,6 +234,7 @@ class Fit(object):
             self.info.pop('condition', None)
         self.result = None
         self._model_settings = {}
+        self._reset_cache()
 
     @property
     def strain_scale(self):
@@ -196,6 +251,8 @@ class Fit(object):
             self._strain_scale = None
         else:
             self._strain_scale = float(scale)
+        # the strain scale enters the run input directly
+        self._run_input_cache = None
 
     @property
     def has_target(self) -> bool:
@@ -225,19 +282,31 @@ class Fit(object):
 
     @property
     def start_times(self):
-        if self.has_target:
-            start_times = self.target.get_detector_times_dict(self.ifos)
-        else:
-            start_times = {}
-        return start_times
+        """Analysis start times for each detector, derived from the target.
+
+        Memoized, and recomputed whenever the data or target change.
+        """
+        if self._start_times_cache is None:
+            if self.has_target:
+                start_times = self.target.get_detector_times_dict(self.ifos)
+            else:
+                start_times = {}
+            self._start_times_cache = start_times
+        return self._start_times_cache
 
     @property
     def antenna_patterns(self):
-        if self.has_target:
-            aps = self.target.get_antenna_patterns_dict(self.ifos)
-        else:
-            aps = {}
-        return aps
+        """Antenna patterns for each detector, derived from the target.
+
+        Memoized, and recomputed whenever the data or target change.
+        """
+        if self._antenna_patterns_cache is None:
+            if self.has_target:
+                aps = self.target.get_antenna_patterns_dict(self.ifos)
+            else:
+                aps = {}
+            self._antenna_patterns_cache = aps
+        return self._antenna_patterns_cache
 
     @property
     def n_modes(self) -> int:
@@ -263,12 +332,16 @@ class Fit(object):
         """Slice of data to be analyzed for each detector. Extracted from
         :attr:`Fit.data` based on information in analysis target
         :attr:`Fit.target`.
+
+        Memoized, and recomputed whenever the data or target change.
         """
-        data = {}
-        i0s = self.start_indices
-        for i, d in self.data.items():
-            data[i] = d.iloc[i0s[i]:i0s[i] + self.n_analyze]
-        return data
+        if self._analysis_data_cache is None:
+            data = {}
+            i0s = self.start_indices
+            for i, d in self.data.items():
+                data[i] = d.iloc[i0s[i]:i0s[i] + self.n_analyze]
+            self._analysis_data_cache = data
+        return self._analysis_data_cache
 
     @property
     def analysis_injections(self) -> dict:
@@ -306,7 +379,7 @@ class Fit(object):
         """Valid prior parameters for the selected model. These can be set
         through :meth:`Fit.update_model`.
         """
-        return [k for k in list(MODEL_ARGS) if k not in RUNTIME_MODEL_ARGS]
+        return list(VALID_MODEL_SETTINGS)
 
     def update_model(self, **kws):
         """Set or modify prior options or other model settings.  For example,
@@ -323,12 +396,9 @@ class Fit(object):
 
         # check whether the option is valid, regardless of case
         for k, v in kws.items():
-            if k in self.valid_model_settings:
-                self._model_settings[k] = v
-            elif k.lower() in self.valid_model_settings:
-                self._model_settings[k] = v
-            elif k.upper() in self.valid_model_settings:
-                self._model_settings[k] = v
+            key = _VALID_MODEL_SETTINGS_LOW.get(k.lower())
+            if key is not None:
+                self._model_settings[key] = v
             else:
                 logging.warning(f"unknown model argument: {k}")
 
@@ -340,7 +410,11 @@ class Fit(object):
     def run_input(self) -> list:
         """Arguments to be passed to model function at runtime:
         [times, strains, ls, fp, fc].
+
+        Memoized, and recomputed whenever the data, ACFs or target change.
         """
+        if self._run_input_cache is not None:
+            return self._run_input_cache
         if not self.has_data:
             raise ValueError("no data loaded")
         if not self.has_target:
@@ -371,25 +445,32 @@ class Fit(object):
         times = [np.array(d.time) - self.start_times[i]
                  for i, d in data_dict.items()]
 
+        # match the active jax precision: casting on the host halves the
+        # amount of data shipped to the device when running on float32
+        dtype = np.float64 if jax.config.x64_enabled else np.float32
+
         # arguments to be passed to function returned by model_function
         # make sure this agrees with that function call!
         # [times, strains, ls, fp, fc]
+        # NOTE: chol(C / scale**2) = chol(C) / scale, so we can reuse the
+        # cached unscaled factors and rescale them on the fly
         input = [
-            times,
-            [s.values / scale for s in data_dict.values()],
-            [(a.iloc[:self.n_analyze] / scale**2).cholesky
-             for a in self.acfs.values()],
+            [t.astype(dtype) for t in times],
+            [(s.values / scale).astype(dtype) for s in data_dict.values()],
+            [(self._get_cholesky(i, self.n_analyze) / scale).astype(dtype)
+             for i in self.acfs],
             fp,
             fc
         ]
+        self._run_input_cache = input
         return input
 
     @property
     def cholesky_factors(self):
         """Cholesky factors of ACFs for each detector.
         """
-        return {i: a.iloc[:self.n_analyze].cholesky
-                for i, a in self.acfs.items()}
+        return {i: self._get_cholesky(i, self.n_analyze)
+                for i in self.acfs}
 
     @classmethod
     def from_config(cls, config_input: str | configparser.ConfigParser,
@@ -727,6 +808,7 @@ class Fit(object):
             new_data[k] = d.condition(t0=t0, **kwargs)
         self._raw_data = self.data
         self.data = new_data
+        self._reset_cache()
         if not preserve_acfs:
             if self.acfs:
                 warn("discarding existing ACFs after conditioning")
@@ -799,9 +881,7 @@ class Fit(object):
             (def. False)
         """
         # record all arguments
-        settings = {k: v for k, v in locals().items() if k != 'self'}
-        for k, v in settings.pop('kws').items():
-            settings[k] = v
+        settings = dict(no_noise=no_noise, **kws)
 
         self.injections = self.get_templates(**kws)
         for i, h in self.injections.items():
@@ -809,6 +889,8 @@ class Fit(object):
                 self.data[i] = h
             else:
                 self.data[i] = self.data[i] + h
+        # injected data invalidate cached analysis slices and run input
+        self._reset_cache()
         self.update_info('injection', **settings)
 
     @property
@@ -996,6 +1078,7 @@ class Fit(object):
             min_ess: int | None = None,
             prng: jaxlib.xla_extension.ArrayImpl | int | None = None,
             validation_enabled: bool = False,
+            compilation_cache: bool | str = False,
             **kwargs):
         """Fit model.
 
@@ -1041,6 +1124,12 @@ class Fit(object):
             if True, run with numpyro.validation_enabled() to get verbose error
             messages
 
+        compilation_cache: bool, str
+            persist compiled sampling kernels to disk so that fresh processes
+            skip recompilation; if a string, interpreted as the cache
+            directory, otherwise defaults to ``~/.cache/ringdown/jax``
+            (def. `False`).
+
         return_model: bool
             returns numpyro model instead of running it (def. `False`).
 
@@ -1053,6 +1142,11 @@ class Fit(object):
             settings[k] = v
         self.update_info('run', **settings)
 
+        if compilation_cache:
+            cache_dir = None if compilation_cache is True \
+                else compilation_cache
+            utils.enable_compilation_cache(cache_dir)
+
         # create model function
         model = self._make_model(prior)
 
@@ -1120,6 +1214,7 @@ class Fit(object):
         if not isinstance(data, Data):
             data = Data(data, index=getattr(data, 'time', time), ifo=ifo)
         self.data[data.ifo] = data
+        self._reset_cache()
         if acf is not None:
             self.acfs[data.ifo] = acf
 
@@ -1394,7 +1489,7 @@ class Fit(object):
             settings['psds'] = {k: str(v) for k, v in psd_origins.items()}
         self.update_info('fake-data', **settings)
 
-    def compute_acfs(self, shared=False, ifos=None, **kws):
+    def compute_acfs(self, shared=False, ifos=None, nproc=None, **kws):
         """Compute ACFs for all data sets in `Fit.data`.
 
         Arguments
@@ -1408,6 +1503,10 @@ class Fit(object):
             specific set of IFOs for which to compute ACF, otherwise computes
             it for all
 
+        nproc : int | None
+            number of processes to use to estimate the ACFs of different
+            detectors in parallel; if None, computes serially (default None)
+
         extra kwargs are passed to ACF constructor
         """
         # record all arguments
@@ -1428,8 +1527,23 @@ class Fit(object):
 
         # if shared, compute a single ACF
         acf = self.data[ifos[0]].get_acf(**kws) if shared else None
-        for ifo in ifos:
-            self.acfs[ifo] = acf if shared else self.data[ifo].get_acf(**kws)
+        if shared or nproc is None or len(ifos) == 1:
+            for ifo in ifos:
+                self.acfs[ifo] = acf if shared \
+                    else self.data[ifo].get_acf(**kws)
+        else:
+            # the per-detector estimates are independent: farm them out
+            with mp.Pool(nproc) as p:
+                acfs = p.map(partial(Data.get_acf, **kws),
+                             [self.data[ifo] for ifo in ifos])
+            for ifo, acf in zip(ifos, acfs):
+                # metadata does not survive pickling: restore it from the
+                # source data, as AutoCovariance.from_data does serially
+                for a in getattr(self.data[ifo], '_meta', []):
+                    setattr(acf, a, getattr(self.data[ifo], a, None))
+                self.acfs[ifo] = acf
+        # new ACFs invalidate cached Cholesky factors and run input
+        self._reset_cache()
         # record ACF computation options
         self.update_info('acf', **settings)
 
@@ -1468,6 +1582,7 @@ class Fit(object):
                 raise ValueError("no IMR result available; load using "
                                  "Fit.load_imr_result")
             self.acfs = self.imr_result.get_acfs(**kws)
+            self._reset_cache()
             self.update_info('acf', **settings)
             return
 
@@ -1479,6 +1594,7 @@ class Fit(object):
                 self.acfs[ifo] = PowerSpectrum.read(p, **kws).to_acf()
             else:
                 self.acfs[ifo] = AutoCovariance.read(p, **kws)
+        self._reset_cache()
         # record ACF computation options
         settings['path'] = path_dict
         self.update_info('acf', **settings)
@@ -1674,6 +1790,9 @@ class Fit(object):
             self.target = Target.construct(t0, ra, dec, psi, reference_ifo,
                                            antenna_patterns, ifos=self.ifos,
                                            duration=duration)
+        # new target invalidates cached start indices and start times;
+        # reset before validating so we check the new target, not the old
+        self._reset_cache()
 
         # make sure that start times are encompassed by data (if data exist)
         for i, data in self.data.items():
@@ -1709,18 +1828,28 @@ class Fit(object):
     def start_indices(self) -> dict:
         """Locations of first samples in :attr:`Fit.data`
         to be included in the ringdown analysis for each detector.
+
+        Memoized, and recomputed whenever the data or target change.
         """
-        i0_dict = {}
-        if self.has_target:
-            # make sure that start times are encompassed by data
-            for i, t0_i in self.start_times.items():
-                if t0_i < self.data[i].time[0] or t0_i > self.data[i].time[-1]:
-                    raise ValueError("{} start time not in data".format(i))
-            # find sample closest to (but no later than) requested start time
-            for ifo, d in self.data.items():
-                t0 = self.start_times[ifo]
-                i0_dict[ifo] = np.argmin(abs(d.time - t0))
-        return i0_dict
+        if self._start_indices is None:
+            i0_dict = {}
+            if self.has_target:
+                start_times = self.start_times
+                for ifo, d in self.data.items():
+                    t0 = start_times[ifo]
+                    t = d.time.values
+                    # make sure that start time is encompassed by data
+                    if t0 < t[0] or t0 > t[-1]:
+                        raise ValueError(
+                            "{} start time not in data".format(ifo))
+                    # find sample closest to requested start time through a
+                    # binary search (times are monotonically increasing)
+                    i = int(np.searchsorted(t, t0))
+                    if i > 0 and (i == len(t) or t0 - t[i-1] < t[i] - t0):
+                        i -= 1
+                    i0_dict[ifo] = i
+            self._start_indices = i0_dict
+        return self._start_indices
 
     @property
     def n_analyze(self) -> int:
@@ -15,7 +15,6 @@ from .utils import get_tqdm, get_hdf5_value, get_bilby_dict, \
     get_dict_from_pattern
 import lal
 import multiprocessing as mp
-from lalsimulation import nrfits
 import logging
 
 MASS_ALIASES = ['final_mass', 'mf', 'mfinal', 'm_final', 'final_mass_source',
@@ -27,6 +26,7 @@ TIME_KEY = '_time'
 
 def get_remnant(mass_1, mass_2, spin_1x, spin_1y, spin_1z,
                 spin_2x, spin_2y, spin_2z, f_ref, model):
+    from lalsimulation import nrfits
     r = nrfits.eval_nrfit(mass_1, mass_2,
                           [spin_1x, spin_1y, spin_1z],
                           [spin_2x, spin_2y, spin_2z],
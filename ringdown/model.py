@@ -597,12 +597,7 @@ def make_model(modes: int | list[(int, int, int, int)],
                 f = numpyro.sample('f', dist.Uniform(f_min, f_max))
                 g = numpyro.sample('g', dist.Uniform(g_min, g_max))
         elif isinstance(modes, list):
-            fcoeffs = []
-            gcoeffs = []
-            for mode in modes:
-                c = qnms.KerrMode(mode).coefficients
-                fcoeffs.append(c[0])
-                gcoeffs.append(c[1])
+            fcoeffs, gcoeffs = qnms.get_mode_coefficients(modes)
             fcoeffs = jnp.array(fcoeffs)
             gcoeffs = jnp.array(gcoeffs)
 
@@ -1,8 +1,9 @@
-__all__ = ['KerrMode', 'get_ftau']
+__all__ = ['KerrMode', 'get_ftau', 'get_mode_coefficients']
 
 import numpy as np
-import qnm
 import lal
+import threading
+from functools import lru_cache
 from . import indexing
 from .utils import docstring_parameter
 
@@ -34,6 +35,7 @@ def get_ftau(M, chi, n, l=2, m=2):  # noqa: E741
     tau : float
         Damping time of the mode in seconds.
     """
+    import qnm
     q22 = qnm.modes_cache(-2, l, m, n)
     omega, _, _ = q22(a=chi)
     f = np.real(omega)/(2*np.pi) / (T_MSUN*M)
@@ -46,6 +48,7 @@ class KerrMode(object):
     """
 
     _cache = {}
+    _cache_lock = threading.Lock()
 
     @docstring_parameter(indexing.HarmonicIndex.construct.__doc__)
     def __init__(self, *args, **kwargs):
@@ -64,12 +67,19 @@ class KerrMode(object):
     @property
     def coefficients(self):
         i = tuple(self.index)
-        if i not in self._cache:
-            self._cache[i] = self.compute_coefficients(i)
-        return self._cache[i]
+        coeffs = self._cache.get(i)
+        if coeffs is None:
+            with self._cache_lock:
+                # re-check under the lock so concurrent threads do not
+                # fit the same mode twice
+                if i not in self._cache:
+                    self._cache[i] = self.compute_coefficients(i)
+                coeffs = self._cache[i]
+        return coeffs
 
     @staticmethod
     def compute_coefficients(mode, **kws):
+        import qnm
         p, s, l, m, n = mode
         sgn = p if m == 0 else p * np.sign(m)
         q = qnm.modes_cache(s, l, p*abs(m), n)
@@ -142,6 +152,7 @@ class KerrMode(object):
 
             f, g = [np.dot(coeff, v) for coeff in self.coefficients]
         else:
+            import qnm
             p, s, l, m, n = self.index
             q = qnm.modes_cache(s, l, p*abs(m), n)
 
@@ -159,6 +170,45 @@ class KerrMode(object):
         return f, 1/g
 
 
+@lru_cache(maxsize=None)
+def _cached_mode_coefficients(modes: tuple) -> tuple:
+    fcoeffs = None
+    gcoeffs = None
+    for i, mode in enumerate(modes):
+        f, g = KerrMode(mode).coefficients
+        if fcoeffs is None:
+            # preallocate once the number of coefficients is known
+            fcoeffs = np.empty((len(modes), len(f)))
+            gcoeffs = np.empty((len(modes), len(g)))
+        fcoeffs[i] = f
+        gcoeffs[i] = g
+    return fcoeffs, gcoeffs
+
+
+def get_mode_coefficients(modes) -> tuple[np.ndarray, np.ndarray]:
+    """Stack frequency and damping-rate spin-expansion coefficients for a
+    list of Kerr modes.
+
+    This is a caching wrapper around :attr:`KerrMode.coefficients`: the
+    stacked arrays are memoized keyed on the mode indices, so repeated model
+    setups with the same mode content reuse the same arrays instead of
+    rebuilding them mode by mode.
+
+    Arguments
+    ---------
+    modes : list
+        list of `(p, s, l, m, n)` mode indices.
+
+    Returns
+    -------
+    fcoeffs : np.ndarray
+        frequency coefficients, with shape ``(n_modes, k)``.
+    gcoeffs : np.ndarray
+        damping-rate coefficients, with shape ``(n_modes, k)``.
+    """
+    return _cached_mode_coefficients(tuple(tuple(m) for m in modes))
+
+
 class ParameterLabel(object):
 
     _PARAMETER_KEY_MAP = {
@@ -205,6 +205,73 @@ class SkyTarget(Target):
                                         self.psi, gmst)
         return tuple(fpfc)
 
+    def _stacked_detector_geometry(self, ifos) -> tuple[np.ndarray,
+                                                        np.ndarray]:
+        """Stack detector locations into a `(N, 3)` array and response
+        tensors into a `(N, 3, 3)` array."""
+        locations = []
+        responses = []
+        for ifo in ifos:
+            if ifo in lal.cached_detector_by_prefix:
+                det = lal.cached_detector_by_prefix[ifo]
+            else:
+                raise ValueError(f"unrecognized detector {ifo}")
+            locations.append(det.location)
+            responses.append(det.response)
+        return np.asarray(locations), np.asarray(responses)
+
+    def get_detector_times_dict(self, ifos) -> dict:
+        """Compute detector times for several detectors at once.
+
+        Equivalent to calling :meth:`get_detector_time` for each detector,
+        but the line-of-sight vector is computed once and the geocenter
+        delays for all detectors are obtained through a single contraction
+        with the stacked detector locations.
+        """
+        if not ifos:
+            return {}
+        locations, _ = self._stacked_detector_geometry(ifos)
+        tgps = lal.LIGOTimeGPS(self.geocenter_time)
+        gmst = lal.GreenwichMeanSiderealTime(tgps)
+        gha = gmst - self.ra
+        # unit vector pointing from the source towards geocenter, in the
+        # same Earth-fixed frame as the detector locations
+        ehat_src = np.array([np.cos(self.dec) * np.cos(gha),
+                             -np.cos(self.dec) * np.sin(gha),
+                             np.sin(self.dec)])
+        dts = -(locations @ ehat_src) / lal.C_SI
+        t0 = float(self.geocenter_time)
+        return {ifo: t0 + dt for ifo, dt in zip(ifos, dts)}
+
+    def get_antenna_patterns_dict(self, ifos) -> dict:
+        """Compute antenna patterns for several detectors at once.
+
+        Equivalent to calling :meth:`get_antenna_patterns` for each
+        detector, but the polarization basis vectors are computed once and
+        contracted against the stacked detector response tensors.
+        """
+        if not ifos:
+            return {}
+        _, responses = self._stacked_detector_geometry(ifos)
+        tgps = lal.LIGOTimeGPS(self.geocenter_time)
+        gmst = lal.GreenwichMeanSiderealTime(tgps)
+        gha = gmst - self.ra
+        cosgha, singha = np.cos(gha), np.sin(gha)
+        cosdec, sindec = np.cos(self.dec), np.sin(self.dec)
+        cospsi, sinpsi = np.cos(self.psi), np.sin(self.psi)
+        # wave-frame basis vectors, as in lal.ComputeDetAMResponse
+        x = np.array([-cospsi * singha - sinpsi * cosgha * sindec,
+                      -cospsi * cosgha + sinpsi * singha * sindec,
+                      sinpsi * cosdec])
+        y = np.array([sinpsi * singha - cospsi * cosgha * sindec,
+                      sinpsi * cosgha + cospsi * singha * sindec,
+                      cospsi * cosdec])
+        fps = np.einsum('i,nij,j->n', x, responses, x) - \
+            np.einsum('i,nij,j->n', y, responses, y)
+        fcs = np.einsum('i,nij,j->n', x, responses, y) + \
+            np.einsum('i,nij,j->n', y, responses, x)
+        return {ifo: (fp, fc) for ifo, fp, fc in zip(ifos, fps, fcs)}
+
     @classmethod
     def construct(cls, t0: float, ra: float, dec: float, psi: float,
                   reference_ifo: str | None = None, duration: float = 0.,
@@ -1,11 +1,12 @@
 __all__ = ['Bounded_2d_kde', 'Bounded_1d_kde', 'kdeplot']
 
 import numpy as np
-from matplotlib import pyplot as plt
 import scipy.stats as ss
-import seaborn as sns
 import pandas as pd
 
+# NOTE: matplotlib and seaborn are imported lazily inside the plotting
+# functions below, to keep them off the hot path of `import ringdown`
+
 
 class Bounded_1d_kde(ss.gaussian_kde):
     """ Represents a one-dimensional Gaussian kernel density estimator
@@ -204,6 +205,7 @@ def kdeplot_2d_clevels(xs, ys, levels=10, fill=False, n_grid=128, **kws):
     kwargs:
         additional arguments passed to plt.contour().
     """
+    from matplotlib import pyplot as plt
     try:
         xs = xs.values.astype(float)
         ys = ys.values.astype(float)
@@ -275,6 +277,8 @@ def kdeplot_2d_clevels(xs, ys, levels=10, fill=False, n_grid=128, **kws):
 
 
 def kdeplot(xs, ys=None, **kws):
+    from matplotlib import pyplot as plt
+    import seaborn as sns
 
     if np.all(~np.isfinite(xs)):
         return None
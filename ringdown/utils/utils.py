@@ -2,12 +2,21 @@
 """
 
 import numpy as np
+import re
 from ast import literal_eval
 import os
 from configparser import ConfigParser
 import logging
 import sys
 
+# strings accepted by float(), including inf/nan spellings and underscore
+# digit separators (which float() only allows between digits); used to
+# avoid raising exceptions on the (common) non-numeric config entries
+_FLOAT_RE = re.compile(
+    r'[+-]?(\d+(_\d+)*(\.(\d+(_\d+)*)?)?|\.\d+(_\d+)*)'
+    r'([eE][+-]?\d+(_\d+)*)?'
+    r'|[+-]?(inf(inity)?|nan)', re.IGNORECASE)
+
 
 def get_tqdm(progress: bool = True):
     """Return the appropriate tqdm based on the execution environment.
@@ -47,16 +56,49 @@ def form_opt(x, key=None, **kws) -> str:
 
 def try_parse(x):
     """Attempt to parse a string as a number, dict, or list."""
-    try:
-        return float(x)
-    except (TypeError, ValueError):
+    if isinstance(x, str):
+        if _FLOAT_RE.fullmatch(x.strip()):
+            try:
+                return float(x)
+            except ValueError:
+                # regex matched something float() rejects: fall through to
+                # the generic parsing below instead of crashing
+                pass
         try:
             return literal_eval(x)
         except (TypeError, ValueError, SyntaxError):
-            if x == "inf":
-                return np.inf
-            else:
-                return x
+            return x
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return x
+
+
+def enable_compilation_cache(cache_dir: str | None = None) -> str:
+    """Enable jax's persistent compilation cache, so that fresh processes
+    reuse compiled sampling kernels from disk instead of recompiling them.
+
+    Arguments
+    ---------
+    cache_dir : str, None
+        directory in which to store compiled kernels; defaults to
+        ``~/.cache/ringdown/jax``.
+
+    Returns
+    -------
+    cache_dir : str
+        the directory in which compiled kernels are stored.
+    """
+    import jax
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache',
+                                 'ringdown', 'jax')
+    os.makedirs(cache_dir, exist_ok=True)
+    jax.config.update('jax_compilation_cache_dir', cache_dir)
+    # only persist kernels that took a non-trivial time to compile
+    jax.config.update('jax_persistent_cache_min_compile_time_secs', 1.0)
+    logging.info(f"jax compilation cache enabled at {cache_dir}")
+    return cache_dir
 
 
 def get_ifo_list(config, section):
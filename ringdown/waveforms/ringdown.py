@@ -1,11 +1,21 @@
 __all__ = ['Ringdown']
 
 import numpy as np
+from functools import lru_cache
 from .core import Signal
 from .. import qnms
 from .. import indexing
 
 
+@lru_cache(maxsize=None)
+def _cached_mode_ftaus(modes: tuple, chi: float, m: float,
+                       approx: bool) -> tuple:
+    """Frequencies and damping times for a set of Kerr modes, memoized so
+    that evaluating the same template at several detectors does not repeat
+    the QNM frequency solves."""
+    return tuple(qnms.KerrMode(mode).ftau(chi, m, approx) for mode in modes)
+
+
 class Ringdown(Signal):
     _metadata = ['modes']
     _MODELS = ['ringdown']
@@ -95,12 +105,17 @@ class Ringdown(Signal):
         freq_keys = ['omega', 'gamma', 'f', 'tau']
         if 'modes' in kws and not any([k in kws for k in freq_keys]):
             kws['approx'] = kws.get('approx', False)
-            kws['f'], kws['tau'] = [], []
-            for m in kws['modes']:
-                f, tau = qnms.KerrMode(m).ftau(kws['chi'], kws['m'],
+            try:
+                ftaus = _cached_mode_ftaus(
+                    tuple(tuple(m) for m in kws['modes']),
+                    float(kws['chi']), float(kws['m']), bool(kws['approx']))
+            except TypeError:
+                # unhashable (e.g. array-valued) parameters: compute directly
+                ftaus = [qnms.KerrMode(m).ftau(kws['chi'], kws['m'],
                                                kws['approx'])
-                kws['f'].append(f)
-                kws['tau'].append(tau)
+                         for m in kws['modes']]
+            kws['f'] = [f for f, _ in ftaus]
+            kws['tau'] = [tau for _, tau in ftaus]
         # frequency parameters
         if 'f' in kws and 'omega' not in kws:
             pars['omega'] = 2*np.pi*np.array(kws.pop('f'), ndmin=ndmin)
@@ -51,6 +51,20 @@ class TestKerrMode:
             assert ftau == pytest.approx(ref, rel=1E-2)
 
 
+def test_get_mode_coefficients():
+    modes = list(FTAU_REF.keys())
+    fcoeffs, gcoeffs = ringdown.qnms.get_mode_coefficients(modes)
+    assert fcoeffs.shape == gcoeffs.shape
+    assert fcoeffs.shape[0] == len(modes)
+    for i, mode in enumerate(modes):
+        f, g = ringdown.qnms.KerrMode(mode).coefficients
+        assert fcoeffs[i] == pytest.approx(f)
+        assert gcoeffs[i] == pytest.approx(g)
+    # repeated calls with the same modes should hit the cache
+    fcoeffs2, _ = ringdown.qnms.get_mode_coefficients(modes)
+    assert fcoeffs2 is fcoeffs
+
+
 def test_get_parameter_label_map():
     ringdown.qnms.get_parameter_label_map(
         pars=ringdown.result._DATAFRAME_PARAMETERS,